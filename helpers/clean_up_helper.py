@@ -1,8 +1,13 @@
 import logging
+import threading
+from concurrent.futures import ALL_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import boto3
+import botocore.session
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from bedrock_agentcore_starter_toolkit.operations.memory.manager import MemoryManager
@@ -12,10 +17,136 @@ from bedrock_agentcore_starter_toolkit.utils.runtime.schema import BedrockAgentC
 from bedrock_agentcore_starter_toolkit.operations.runtime.exceptions import RuntimeToolkitException
 from bedrock_agentcore_starter_toolkit.operations.runtime.models import DestroyResult
 
-from bedrock_agentcore_starter_toolkit.operations.runtime.destroy import (_destroy_agentcore_endpoint, _destroy_agentcore_agent, _destroy_codebuild_project, _destroy_ecr_images, _cleanup_agent_config)
+from bedrock_agentcore_starter_toolkit.operations.runtime.destroy import (_destroy_agentcore_endpoint, _destroy_agentcore_agent, _destroy_codebuild_project, _delete_ecr_repository, _destroy_memory, _cleanup_agent_config)
 
 log = logging.getLogger(__name__)
 
+# ECR accepts at most 100 image ids per batch_delete_image request
+ECR_BATCH_DELETE_LIMIT = 100
+
+CLIENT_CONFIG = Config(retries={"mode": "adaptive"}, max_pool_connections=20, tcp_keepalive=True)
+
+
+@lru_cache(maxsize=32)
+def _get_session(region: str, owner: str = "main") -> boto3.Session:
+    """Return a cached session for region, so credentials are resolved once per owner.
+
+    Sessions are not thread-safe, so each destroy step (owner) gets its own session, which is
+    reused across calls. Every client created from it, including those created inside the
+    toolkit helpers, defaults to CLIENT_CONFIG.
+    """
+    botocore_session = botocore.session.get_session()
+    botocore_session.set_default_client_config(CLIENT_CONFIG)
+    return boto3.Session(botocore_session=botocore_session, region_name=region)
+
+
+@lru_cache(maxsize=32)
+def _get_client(region: str, service: str):
+    """Return a cached client for service in region, reusing its connection pool across calls.
+
+    Clients are thread-safe once created, but sessions are not, so call this from the main
+    thread before handing the client to workers.
+    """
+    return _get_session(region).client(service)
+
+
+def _destroy_ecr_images_batched(session, agent_config, result, dry_run, delete_repo):
+    """Remove all ECR images, and optionally the repository, for this agent.
+
+    Unlike the toolkit helper this pages through list_images, so repositories with more than
+    one page of images are fully cleaned, and deletes them in batches of ECR_BATCH_DELETE_LIMIT.
+    """
+    if not agent_config.aws.ecr_repository:
+        result.warnings.append("No ECR repository configured, skipping image cleanup")
+        return
+
+    # Format: account.dkr.ecr.region.amazonaws.com/repo-name
+    repo_name = agent_config.aws.ecr_repository.split("/")[-1]
+    ecr = _get_client(agent_config.aws.region, "ecr")
+
+    try:
+        # like the toolkit, tagged images are deleted by tag and untagged ones by digest
+        unique_ids = {}
+        for page in ecr.get_paginator("list_images").paginate(repositoryName=repo_name):
+            for image in page.get("imageIds", []):
+                key = "imageTag" if image.get("imageTag") else "imageDigest"
+                if image.get(key):
+                    unique_ids[(key, image[key])] = {key: image[key]}
+        image_ids = list(unique_ids.values())
+
+        if not image_ids and not delete_repo:
+            result.warnings.append(f"No images found in ECR repository: {repo_name}")
+            return
+
+        if dry_run:
+            if image_ids:
+                result.resources_removed.append(f"ECR images: {len(image_ids)} images from {repo_name} (DRY RUN)")
+            if delete_repo:
+                result.resources_removed.append(f"ECR repository: {repo_name} (DRY RUN)")
+            return
+
+        total_deleted = 0
+        for i in range(0, len(image_ids), ECR_BATCH_DELETE_LIMIT):
+            response = ecr.batch_delete_image(
+                repositoryName=repo_name, imageIds=image_ids[i : i + ECR_BATCH_DELETE_LIMIT]
+            )
+            total_deleted += len(response.get("imageIds", []))
+            for failure in response.get("failures", []):
+                result.errors.append(
+                    f"Failed to delete ECR image {failure.get('imageId')}: {failure.get('failureReason')}"
+                )
+
+        if total_deleted:
+            result.resources_removed.append(f"ECR images: {total_deleted} images from {repo_name}")
+            log.info("Deleted %d ECR images from %s", total_deleted, repo_name)
+
+        if delete_repo:
+            if total_deleted == len(image_ids):
+                _delete_ecr_repository(ecr, repo_name, result)
+            else:
+                result.warnings.append(f"Cannot delete ECR repository {repo_name}: some images failed to delete")
+
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "RepositoryNotFoundException":
+            result.warnings.append(f"ECR repository {repo_name} not found")
+        else:
+            result.errors.append(f"Failed to delete ECR images from {repo_name}: {e}")
+            log.error("Failed to delete ECR images: %s", e)
+
+
+def _destroy_memory_if_created(session, agent_config, result, dry_run):
+    """Delete the agent memory only if the toolkit created it."""
+    if agent_config.memory and agent_config.memory.memory_id and agent_config.memory.mode != "NO_MEMORY":
+        if agent_config.memory.was_created_by_toolkit:
+            # Memory was created by toolkit during configure/launch - delete it
+            _destroy_memory(session, agent_config, result, dry_run)
+            if not dry_run:
+                log.info("Deleted memory (was created by toolkit): %s", agent_config.memory.memory_id)
+        else:
+            # Memory was pre-existing - preserve it
+            result.warnings.append(f"Memory {agent_config.memory.memory_id} preserved (was pre-existing)")
+            log.info("Preserving pre-existing memory: %s", agent_config.memory.memory_id)
+
+
+def _run_destroy_step(step, agent_config, result, lock, dry_run, *args):
+    """Run one destroy step in a worker thread and merge its outcome into result.
+
+    boto3 sessions are not thread-safe, so each step gets its own cached session and its own
+    DestroyResult, which is merged into the shared result under lock once it finishes.
+    """
+    session = _get_session(agent_config.aws.region, step.__name__)
+    step_result = DestroyResult(agent_name=result.agent_name, dry_run=dry_run)
+    try:
+        step(session, agent_config, step_result, dry_run, *args)
+    except Exception as e:
+        log.error("%s failed: %s", step.__name__, str(e))
+        step_result.errors.append(f"{step.__name__} failed: {e}")
+    finally:
+        with lock:
+            result.resources_removed.extend(step_result.resources_removed)
+            result.warnings.extend(step_result.warnings)
+            result.errors.extend(step_result.errors)
+
 
 def destroy_bedrock_agentcore(
     config_path: Path,
@@ -64,34 +195,28 @@ def destroy_bedrock_agentcore(
             result.warnings.append("Agent is not deployed, nothing to destroy")
             return result
 
-        # Initialize AWS session and clients
-        session = boto3.Session(region_name=agent_config.aws.region)
+        # Initialize AWS session and clients; the ECR client is created here, before the
+        # worker threads start, because the cached session must not be used concurrently
+        session = _get_session(agent_config.aws.region)
+        _get_client(agent_config.aws.region, "ecr")
 
-        # 1. Destroy Bedrock AgentCore endpoint (if exists)
+        # 1. Destroy Bedrock AgentCore endpoint (if exists); must precede agent deletion
         _destroy_agentcore_endpoint(session, agent_config, result, dry_run)
 
-        # 2. Destroy Bedrock AgentCore agent
-        _destroy_agentcore_agent(session, agent_config, result, dry_run)
-
-        # 3. Remove ECR images and optionally the repository (only for container deployments)
-       
-        _destroy_ecr_images(session, agent_config, result, dry_run, delete_ecr_repo)
-
-        # 4. Remove CodeBuild project (only for container deployments)
-        _destroy_codebuild_project(session, agent_config, result, dry_run)
-    
-
-        # 5. Remove memory resource
-        if agent_config.memory and agent_config.memory.memory_id and agent_config.memory.mode != "NO_MEMORY":
-            if agent_config.memory.was_created_by_toolkit:
-                # Memory was created by toolkit during configure/launch - delete it
-                _destroy_memory(session, agent_config, result, dry_run)
-                if not dry_run:
-                    log.info("Deleted memory (was created by toolkit): %s", agent_config.memory.memory_id)
-            else:
-                # Memory was pre-existing - preserve it
-                result.warnings.append(f"Memory {agent_config.memory.memory_id} preserved (was pre-existing)")
-                log.info("Preserving pre-existing memory: %s", agent_config.memory.memory_id)
+        # 2-5. The remaining resources are independent, so remove them concurrently:
+        # the agent, ECR images and optionally the repository (only for container deployments),
+        # the CodeBuild project (only for container deployments) and the memory resource
+        lock = threading.Lock()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(_run_destroy_step, _destroy_agentcore_agent, agent_config, result, lock, dry_run),
+                executor.submit(
+                    _run_destroy_step, _destroy_ecr_images_batched, agent_config, result, lock, dry_run, delete_ecr_repo
+                ),
+                executor.submit(_run_destroy_step, _destroy_codebuild_project, agent_config, result, lock, dry_run),
+                executor.submit(_run_destroy_step, _destroy_memory_if_created, agent_config, result, lock, dry_run),
+            ]
+            wait(futures, return_when=ALL_COMPLETED)
 
         # 6. Remove CodeBuild IAM Role (only for container deployments)
         # if agent_config.deployment_type == "container":
@@ -1,13 +1,25 @@
+import numpy as np
 import pandas as pd
 from faker import Faker
+import datetime as dt
+import json
 import random
 import uuid
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- 1. CONFIGURATION ---
 NUM_PEOPLE = 1000  # Number of unique individuals to generate
 OUTPUT_PATH = Path("synthetic_data")  # Directory to save output files
 OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
+
+ACCOUNT_TYPES = ["Credit Card", "Auto Loan", "Mortgage", "Student Loan", "HELOC"]
+CREDIT_LIMITS = [2500, 5000, 10000, 15000, 20000]
+LIEN_HOLDERS = ["IRS", "State Tax Board", "County Clerk"]
 # Initialize the Faker generator
 
 random.seed(42)
@@ -16,54 +28,95 @@ Faker.seed(42)
 fake = Faker()
 
 
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+VOWELS = "aeiou"
+WILLIAM_NICKNAMES = ("Bill", "Will", "Billy")
+STREET_ABBREVIATIONS = {
+    "Street": "St.",
+    "Avenue": "Ave.",
+    "Road": "Rd.",
+    "Drive": "Dr.",
+}
+STREET_TYPES = tuple(STREET_ABBREVIATIONS)
+
+
 def perturb_name(full_name):
     """Applies a random common variation to a person's name."""
+    # pick the variation first so only that one is built
+    option = random.randrange(6)
+
+    # Option 6: No change
+    if option == 5:
+        return full_name
+
     first, last = full_name.split(" ", 1)
 
-    options = [
+    if option == 0:
         # Option 1: Middle initial (if possible)
-        f"{first} {random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}. {last}",
+        return f"{first} {random.choice(ALPHABET)}. {last}"
+    if option == 1:
         # Option 2: First initial only
-        f"{first[0]}. {last}",
+        return f"{first[0]}. {last}"
+    if option == 2:
         # Option 3: Last name first
-        f"{last}, {first}",
+        return f"{last}, {first}"
+    if option == 3:
         # Option 4: Simple typo
-        f"{first[:-2]}{random.choice('aeiou')}{first[-1]} {last}",
-        # Option 5: Nickname (simple version)
-        (
-            f"{random.choice(['Bill', 'Will', 'Billy'])} {last}"
-            if first == "William"
-            else full_name
-        ),
-        # Option 6: No change
-        full_name,
-    ]
-    return random.choice(options)
+        return f"{first[:-2]}{random.choice(VOWELS)}{first[-1]} {last}"
+    # Option 5: Nickname (simple version)
+    if first == "William":
+        return f"{random.choice(WILLIAM_NICKNAMES)} {last}"
+    return full_name
 
 
 def perturb_address(full_address):
     """Applies a random common variation to an address string."""
+    # pick the variation first so only that one is built
+    option = random.randrange(4)
+
+    # Option 4: No change
+    if option == 3:
+        return full_address.replace("\n", ", ")
+
     address_parts = full_address.split("\n")
     street_address = address_parts[0]
     city_state_zip = address_parts[1]
 
-    replacements = {"Street": "St.", "Avenue": "Ave.", "Road": "Rd.", "Drive": "Dr."}
-
-    # Option 1: Abbreviate street type
-    street_type = random.choice(list(replacements.keys()))
-    street_address = street_address.replace(street_type, replacements[street_type])
+    # all remaining options abbreviate the street type
+    street_type = random.choice(STREET_TYPES)
+    street_address = street_address.replace(
+        street_type, STREET_ABBREVIATIONS[street_type]
+    )
 
-    options = [
+    if option == 0:
         # Option 1: Abbreviate street type
-        street_address,
+        return street_address
+    if option == 1:
         # Option 2: Drop the ZIP code
-        f"{street_address}\n{city_state_zip.rsplit(' ', 1)[0]}",
-        # Option 3: Make a typo in the street name
-        f"{street_address[:-5]}{random.choice('aeiou')}{street_address[-4:]}\n{city_state_zip}",
-        # Option 4: No change
-        full_address,
-    ]
-    return random.choice(options).replace("\n", ", ")
+        return f"{street_address}, {city_state_zip.rsplit(' ', 1)[0]}"
+    # Option 3: Make a typo in the street name
+    typo = random.choice(VOWELS)
+    return f"{street_address[:-5]}{typo}{street_address[-4:]}, {city_state_zip}"
+
+
+def to_epoch_millis(date):
+    """Converts a date to epoch milliseconds, as pandas wrote dates in json."""
+    midnight = dt.datetime.combine(date, dt.time(), tzinfo=dt.timezone.utc)
+    return int(midnight.timestamp()) * 1000
+
+
+def write_json_lines(records, path):
+    """Writes one compact json object per line, using orjson when available."""
+    with open(path, "wb") as f:
+        if orjson is not None:
+            f.writelines(
+                orjson.dumps(r, option=orjson.OPT_APPEND_NEWLINE) for r in records
+            )
+        else:
+            f.writelines(
+                (json.dumps(r, separators=(",", ":")) + "\n").encode("utf-8")
+                for r in records
+            )
 
 
 # --- 3. DATA GENERATION ---
@@ -76,58 +129,97 @@ income_records = []
 property_records = []
 lien_records = []
 
-for _ in range(NUM_PEOPLE):
+# Numeric fields are drawn in batches for everyone up front; Faker and the
+# string perturbations below are the only per-person Python work.
+rng = np.random.default_rng(42)
+
+# --- Generate Credit Report tradelines (vectorized over all accounts) ---
+num_accounts = rng.integers(2, 9, size=NUM_PEOPLE)
+person_index = np.repeat(np.arange(NUM_PEOPLE), num_accounts)
+total_accounts = int(num_accounts.sum())
+
+account_types = rng.choice(ACCOUNT_TYPES, size=total_accounts)
+is_credit_card = account_types == "Credit Card"
+is_auto_loan = account_types == "Auto Loan"
+is_mortgage = account_types == "Mortgage"
+# anything else is a Student Loan or HELOC
+
+limits = np.where(
+    is_credit_card, rng.choice(CREDIT_LIMITS, size=total_accounts), np.nan
+)
+balances = np.select(
+    [is_credit_card, is_auto_loan, is_mortgage],
+    [
+        rng.uniform(0.1, 0.9, size=total_accounts) * limits,
+        rng.uniform(5000, 45000, size=total_accounts),
+        rng.uniform(150000, 750000, size=total_accounts),
+    ],
+    rng.uniform(10000, 100000, size=total_accounts),
+).round(2)
+payments = np.select(
+    [is_credit_card, is_auto_loan, is_mortgage],
+    [
+        balances * rng.uniform(0.02, 0.05, size=total_accounts),
+        balances / rng.integers(36, 73, size=total_accounts),
+        balances / rng.integers(180, 361, size=total_accounts),
+    ],
+    balances / 120,
+).round(2)
+utilization = (balances / limits).round(2)
+
+df_tradelines = pd.DataFrame(
+    {
+        "account_type": account_types.tolist(),
+        "balance": balances.tolist(),
+        "monthly_payment": payments.tolist(),
+        # credit cards are the only accounts with a limit
+        "credit_limit": [
+            int(limit) if card else None
+            for limit, card in zip(limits.tolist(), is_credit_card.tolist())
+        ],
+        "utilization_ratio": [
+            ratio if card else None
+            for ratio, card in zip(utilization.tolist(), is_credit_card.tolist())
+        ],
+    },
+    dtype=object,
+)
+tradelines_by_person = (
+    pd.Series(df_tradelines.to_dict(orient="records"))
+    .groupby(person_index)
+    .agg(list)
+    .tolist()
+)
+
+# --- Per-person draws ---
+credit_scores = rng.integers(450, 851, size=NUM_PEOPLE).tolist()
+salaries = rng.uniform(45000, 250000, size=NUM_PEOPLE).round(2).tolist()
+# Not everyone owns property, and a small percentage of properties have liens
+owns_property = (rng.random(NUM_PEOPLE) < 0.7).tolist()
+has_lien = (rng.random(NUM_PEOPLE) < 0.15).tolist()
+assessed_values = rng.uniform(200000, 1500000, size=NUM_PEOPLE).round(2).tolist()
+lien_holders = rng.choice(LIEN_HOLDERS, size=NUM_PEOPLE).tolist()
+lien_amounts = rng.uniform(5000, 75000, size=NUM_PEOPLE).round(2).tolist()
+
+gov_ids = [fake.ssn() for _ in range(NUM_PEOPLE)]
+
+for i in range(NUM_PEOPLE):
     # Create a "ground truth" identity for one person
-    gov_id = fake.ssn()
+    gov_id = gov_ids[i]
     true_name = fake.name()
     true_dob = fake.date_of_birth(minimum_age=25, maximum_age=70)
     true_address = fake.address()
 
     # --- Generate Credit Report (The "Anchor") ---
     # This record has the cleanest data.
-    tradelines = []
-    num_accounts = random.randint(2, 8)
-    total_monthly_payments = 0
-    for _ in range(num_accounts):
-        account_type = random.choice(
-            ["Credit Card", "Auto Loan", "Mortgage", "Student Loan", "HELOC"]
-        )
-        balance = 0
-        limit = None
-        payment = 0
-        if account_type == "Credit Card":
-            limit = random.choice([2500, 5000, 10000, 15000, 20000])
-            balance = round(random.uniform(0.1, 0.9) * limit, 2)
-            payment = round(balance * random.uniform(0.02, 0.05), 2)
-        elif account_type == "Auto Loan":
-            balance = round(random.uniform(5000, 45000), 2)
-            payment = round(balance / random.randint(36, 72), 2)
-        elif account_type == "Mortgage":
-            balance = round(random.uniform(150000, 750000), 2)
-            payment = round(balance / random.randint(180, 360), 2)
-        else:  # Student Loan or HELOC
-            balance = round(random.uniform(10000, 100000), 2)
-            payment = round(balance / 120, 2)
-
-        total_monthly_payments += payment
-        tradelines.append(
-            {
-                "account_type": account_type,
-                "balance": balance,
-                "monthly_payment": payment,
-                "credit_limit": limit,
-                "utilization_ratio": round(balance / limit, 2) if limit else None,
-            }
-        )
-
     credit_reports.append(
         {
             "government_id": gov_id,
             "full_legal_name": true_name,
-            "date_of_birth": true_dob,
+            "date_of_birth": to_epoch_millis(true_dob),
             "primary_address": true_address.replace("\n", ", "),
-            "credit_score": random.randint(450, 850),
-            "account_tradelines": tradelines,
+            "credit_score": credit_scores[i],
+            "account_tradelines": tradelines_by_person[i],
         }
     )
 
@@ -137,13 +229,12 @@ for _ in range(NUM_PEOPLE):
             "government_id": gov_id,
             "employee_name": perturb_name(true_name),  # Perturbed name
             "employer_name": fake.company(),
-            "verified_annual_salary": round(random.uniform(45000, 250000), 2),
+            "verified_annual_salary": salaries[i],
         }
     )
 
     # --- Generate Property Record (Fuzzy Link) ---
-    # Not everyone owns property
-    if random.random() < 0.7:
+    if owns_property[i]:
         prop_id = str(uuid.uuid4())
         prop_address = true_address  # Start with the true address
 
@@ -152,62 +243,39 @@ for _ in range(NUM_PEOPLE):
                 "property_id": prop_id,
                 "owner_name_on_deed": perturb_name(true_name),  # Perturbed name
                 "property_address": perturb_address(prop_address),  # Perturbed address
-                "assessed_value": round(random.uniform(200000, 1500000), 2),
+                "assessed_value": assessed_values[i],
             }
         )
 
         # --- Generate Lien Record (Fuzzy Link on top of Property) ---
-        # A small percentage of properties have liens
-        if random.random() < 0.15:
+        if has_lien[i]:
             lien_records.append(
                 {
                     "lien_id": str(uuid.uuid4()),
                     "property_id": prop_id,
                     "debtor_name": perturb_name(true_name),  # Perturbed again!
                     "debtor_address": perturb_address(prop_address),  # Perturbed again!
-                    "lien_holder": random.choice(
-                        ["IRS", "State Tax Board", "County Clerk"]
-                    ),
-                    "lien_amount": round(random.uniform(5000, 75000), 2),
+                    "lien_holder": lien_holders[i],
+                    "lien_amount": lien_amounts[i],
                     "lien_status": "Active",
                 }
             )
 
 
-# --- 4. CREATE AND SAVE DATAFRAMES ---
-
-print("Generation complete. Converting to DataFrames and saving json-lines files...")
+# --- 4. SAVE JSON-LINES FILES ---
 
-# Convert lists of dictionaries to pandas DataFrames
-df_credit = pd.DataFrame(credit_reports)
-df_income = pd.DataFrame(income_records)
-df_property = pd.DataFrame(property_records)
-df_liens = pd.DataFrame(lien_records)
-
-# Save to JSON files
-df_credit.to_json(
-    OUTPUT_PATH / "synthetic_credit_reports.json",
-    orient="records",
-    lines=True,
-)
+print("Generation complete. Saving json-lines files...")
 
-
-df_income.to_json(
-    OUTPUT_PATH / "synthetic_income_verification.json",
-    orient="records",
-    lines=True,
-)
-df_property.to_json(
-    OUTPUT_PATH / "synthetic_property_records.json",
-    orient="records",
-    lines=True,
-)
-df_liens.to_json(
-    OUTPUT_PATH / "synthetic_lien_records.json", orient="records", lines=True
-)
+for file_name, records in [
+    ("synthetic_credit_reports.json", credit_reports),
+    ("synthetic_income_verification.json", income_records),
+    ("synthetic_property_records.json", property_records),
+    ("synthetic_lien_records.json", lien_records),
+]:
+    write_json_lines(records, OUTPUT_PATH / file_name)
 
 print("\nSuccessfully created 4 JSON files:")
-print(f" - synthetic_credit_reports.json ({len(df_credit)} rows)")
-print(f" - synthetic_income_verification.json ({len(df_income)} rows)")
-print(f" - synthetic_property_records.json ({len(df_property)} rows)")
-print(f" - synthetic_lien_records.json ({len(df_liens)} rows)")
+print(f" - synthetic_credit_reports.json ({len(credit_reports)} rows)")
+print(f" - synthetic_income_verification.json ({len(income_records)} rows)")
+print(f" - synthetic_property_records.json ({len(property_records)} rows)")
+print(f" - synthetic_lien_records.json ({len(lien_records)} rows)")
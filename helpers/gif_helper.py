@@ -24,14 +24,16 @@ def pngs_to_gif(
     if not files:
         raise ValueError(f"No files found in {dirname} matching {pattern}")
 
-    frames = [Image.open(f).convert("RGBA") for f in files]
+    # open frames lazily: Pillow quantizes each one to a palette frame (keeping
+    # transparency) as it collects them, so only one RGBA frame is held at a time
+    frames = (Image.open(f).convert("RGBA") for f in files)
     duration = int(1000 / max(1, fps))  # ms per frame
 
     # Save GIF
-    frames[0].save(
+    next(frames).save(
         output_path,
         save_all=True,
-        append_images=frames[1:],
+        append_images=frames,
         duration=duration,
         loop=loop,
         optimize=True,
@@ -1,4 +1,7 @@
+import asyncio
+import atexit
 import os
+import time
 
 import boto3
 
@@ -36,6 +39,11 @@ Use the tools at your disposal to gather the necessary information to help suppo
 
 KYC_AGENT = None
 MCP_CLIENT = None
+# guards the one-time agent initialization against concurrent first requests
+_init_lock = asyncio.Lock()
+# number of in-flight requests using each MCP client; a client that was replaced
+# after a failure is closed by the last request still using it
+_client_users: dict[MCPClient, int] = {}
 MODEL = BedrockModel(
     model_id=os.getenv("MODEL_ID", "global.anthropic.claude-haiku-4-5-20251001-v1:0"),
     temperature=0.0,
@@ -43,6 +51,11 @@ MODEL = BedrockModel(
 
 APP = BedrockAgentCoreApp()
 
+# streamed tokens are batched before being sent to the client; a buffer is flushed
+# once it holds STREAM_FLUSH_BYTES or its oldest chunk is STREAM_FLUSH_SECONDS old
+STREAM_FLUSH_BYTES = 16384
+STREAM_FLUSH_SECONDS = 0.02
+
 # this decorator will obtain an OAuth2 access token using the M2M flow and inject it
 # into the decorated function as the 'oauth2_token' parameter
 @requires_access_token(
@@ -61,14 +74,61 @@ def initialize_kyc_agent_and_tools(
         )
     )
 
-    with mcp_client:
+    # the MCP session is opened once and kept open for the lifetime of the worker,
+    # instead of being re-entered (and re-negotiated) on every request
+    mcp_client.__enter__()
+    try:
         tools = mcp_client.list_tools_sync()
 
         agent = Agent(model=model, system_prompt=system_prompt, tools=tools)
+    except Exception:
+        mcp_client.__exit__(None, None, None)
+        raise
+
+    atexit.register(mcp_client.__exit__, None, None, None)
 
     return mcp_client, agent
 
 
+async def reset_kyc_agent(mcp_client: MCPClient) -> None:
+    """Drop the cached agent so the next request re-initializes with a new MCP session."""
+    global KYC_AGENT, MCP_CLIENT
+
+    async with _init_lock:
+        # another request may already have replaced the failed client
+        if MCP_CLIENT is mcp_client:
+            KYC_AGENT = None
+            MCP_CLIENT = None
+
+
+async def release_mcp_client(mcp_client: MCPClient) -> None:
+    """Mark a request as done with mcp_client, closing it if it was replaced and is unused."""
+    _client_users[mcp_client] -= 1
+    if _client_users[mcp_client] or mcp_client is MCP_CLIENT:
+        return
+
+    del _client_users[mcp_client]
+    atexit.unregister(mcp_client.__exit__)
+    try:
+        await asyncio.to_thread(mcp_client.__exit__, None, None, None)
+    except Exception:
+        pass
+
+
+def is_stream_boundary(event: dict) -> bool:
+    """Return True for events after which the stream may pause, e.g. a tool call.
+
+    Raw model chunks ({"event": ...}) arrive alongside every text token, so only a
+    raw chunk that starts a tool use block counts as a boundary.
+    """
+    if "current_tool_use" in event or "message" in event:
+        return True
+    chunk = event.get("event")
+    if isinstance(chunk, dict):
+        return "toolUse" in chunk.get("contentBlockStart", {}).get("start", {})
+    return False
+
+
 @APP.entrypoint
 async def invoke_kyc_agent(payload: dict[str, str]):
 
@@ -80,19 +140,54 @@ async def invoke_kyc_agent(payload: dict[str, str]):
         raise ValueError("MCP_URL environment variable is not set")
 
     if KYC_AGENT is None or MCP_CLIENT is None:
-        MCP_CLIENT, KYC_AGENT = initialize_kyc_agent_and_tools(
-            model=MODEL,
-            system_prompt=KYC_RESEARCH_AGENT_PROMPT,
-            mcp_url=mcp_url,
-        )
-
-    with MCP_CLIENT:
-
-        # instead of response = str(KYC_AGENT(payload["input"]))
-        # we will stream the response
-        async for event in KYC_AGENT.stream_async(payload["input"]):
-            if "data" in event:
-                yield event["data"]
+        async with _init_lock:
+            if KYC_AGENT is None or MCP_CLIENT is None:
+                # initialization is synchronous (OAuth2 token fetch and MCP handshake),
+                # so run it in a thread to keep the event loop serving other requests
+                MCP_CLIENT, KYC_AGENT = await asyncio.to_thread(
+                    initialize_kyc_agent_and_tools,
+                    model=MODEL,
+                    system_prompt=KYC_RESEARCH_AGENT_PROMPT,
+                    mcp_url=mcp_url,
+                )
+
+    # the MCP session stays open between requests; if it fails (e.g. the MCP server
+    # restarted), the agent is re-initialized on the next request
+    mcp_client, agent = MCP_CLIENT, KYC_AGENT
+    _client_users[mcp_client] = _client_users.get(mcp_client, 0) + 1
+
+    # instead of response = str(KYC_AGENT(payload["input"]))
+    # we will stream the response
+    buffer = []
+    buffer_size = 0
+    buffer_started = 0.0
+    try:
+        async for event in agent.stream_async(payload["input"]):
+            data = event.get("data")
+            if data:
+                if not buffer:
+                    buffer_started = time.monotonic()
+                buffer.append(data)
+                buffer_size += len(data)
+
+            # a tool call or finished message may be followed by a long pause,
+            # so text buffered before it is sent right away
+            if buffer and (
+                is_stream_boundary(event)
+                or buffer_size >= STREAM_FLUSH_BYTES
+                or time.monotonic() - buffer_started >= STREAM_FLUSH_SECONDS
+            ):
+                yield "".join(buffer)
+                buffer.clear()
+                buffer_size = 0
+
+        if buffer:
+            yield "".join(buffer)
+    except Exception:
+        await reset_kyc_agent(mcp_client)
+        raise
+    finally:
+        await release_mcp_client(mcp_client)
 
 
 if __name__ == "__main__":
@@ -1,14 +1,131 @@
 from pathlib import Path
-from rank_bm25 import BM25Okapi
 import datetime as dt
 import json
 from dataclasses import dataclass
 
+import numpy as np
 
-def char_ngrams(text, n):
-    """Generate character-level n-grams"""
-    text = text.lower()
-    return [text[i : i + n] for i in range(len(text) - n + 1)]
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+
+def read_json_lines(file_path: str | Path) -> list[dict]:
+    """
+    Read a json-lines file into a list of records, one per line.
+
+    Args:
+        file_path (str | Path): Path to the json-lines file.
+
+    Returns:
+        list[dict]: One record per line.
+    """
+    with open(file_path, "rb") as f:
+        return [json_loads(line) for line in f]
+
+
+def normalize_text(text: str) -> bytes:
+    """Lowercase and utf-8 encode text, the form both documents and queries are indexed in"""
+    return text.lower().encode("utf-8")
+
+
+def _bigrams(b: bytes) -> np.ndarray:
+    """Byte bigrams of b as uint16 ids, (first byte << 8) | second byte"""
+    a = np.frombuffer(b, dtype=np.uint8)
+    return (a[:-1].astype(np.uint16) << 8) | a[1:]
+
+
+def hashed_bigrams(encoded: list[bytes]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Hash the byte bigrams of each normalized text into uint16 ids.
+
+    All texts are concatenated into a single buffer so the hashing is one
+    vectorized pass; bigrams spanning two texts are dropped.
+
+    Args:
+        encoded (list[bytes]): The texts to tokenize, as returned by normalize_text.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The text index and hash of every bigram.
+    """
+    lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=len(encoded))
+    doc_ids = np.repeat(np.arange(len(encoded)), lengths)
+
+    hashes = _bigrams(b"".join(encoded))
+    same_doc = doc_ids[:-1] == doc_ids[1:]
+
+    return doc_ids[:-1][same_doc], hashes[same_doc]
+
+
+# byte bigrams are uint16 ids, so every possible bigram has its own column
+N_BIGRAMS = 1 << 16
+
+
+@dataclass
+class SparseBM25:
+    """
+    BM25 (Okapi) index over byte bigrams, stored as a sparse matrix with one column
+    per possible bigram.
+
+    Uses the same k1, b and idf flooring as the Okapi variant of BM25 in rank_bm25.
+    The BM25 weight of every (document, bigram) pair is computed at build time, so
+    scoring a query is a single sparse matrix-vector product.
+    """
+
+    rows: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+    idf: np.ndarray
+    n_docs: int
+
+    @classmethod
+    def from_corpus(
+        cls, corpus: list[bytes], k1: float = 1.5, b: float = 0.75, epsilon: float = 0.25
+    ):
+        n_docs = len(corpus)
+        doc_ids, hashes = hashed_bigrams(corpus)
+
+        # collapse repeated (doc, bigram) pairs into term frequencies, sorted by row
+        keys, tf = np.unique(doc_ids * N_BIGRAMS + hashes, return_counts=True)
+        rows, cols = np.divmod(keys, N_BIGRAMS)
+        tf = tf.astype(np.float32)
+
+        doc_len = np.bincount(doc_ids, minlength=n_docs).astype(np.float32)
+        avgdl = doc_len.mean() if n_docs and doc_len.any() else 1.0
+
+        doc_freq = np.bincount(cols, minlength=N_BIGRAMS)
+        idf = (np.log(n_docs - doc_freq + 0.5) - np.log(doc_freq + 0.5)).astype(np.float32)
+        # floor negative idf (bigrams in most docs) to a fraction of the mean idf of the
+        # bigrams that occur in the corpus
+        present = doc_freq > 0
+        if present.any():
+            idf[present & (idf < 0)] = epsilon * idf[present].mean()
+        idf[~present] = 0.0
+
+        norm = k1 * (1 - b + b * doc_len[rows] / avgdl)
+        weights = idf[cols] * tf * (k1 + 1) / (tf + norm)
+
+        return cls(rows, cols, weights.astype(np.float32), idf, n_docs)
+
+    def get_scores(self, text: str) -> np.ndarray:
+        """
+        Score every document in the index against a query string.
+
+        Args:
+            text (str): The query string.
+
+        Returns:
+            np.ndarray: One BM25 score per document.
+        """
+        # repeated query bigrams count once per occurrence
+        q_idx, q_counts = np.unique(_bigrams(normalize_text(text)), return_counts=True)
+        query = np.zeros(N_BIGRAMS, dtype=np.float32)
+        query[q_idx] = q_counts
+
+        # sparse matvec: sum weights * query per document, accumulated in float64
+        contributions = (self.weights * query[self.indices]).astype(np.float64)
+        return np.bincount(self.rows, weights=contributions, minlength=self.n_docs)
 
 
 @dataclass
@@ -20,12 +137,22 @@ class KYCQueryEngine:
 
     def __post_init__(self):
 
+        # tokenization is specialized to byte bigrams
+        if self.ngram_size != 2:
+            raise ValueError(f"Only ngram_size=2 is supported, got {self.ngram_size}")
+
         self.field_indexes = {}
 
         for field in self.text_fields_to_index:
-            corpus = [str(doc.get(field, "")) for doc in self.data]
-            tokenized_corpus = [char_ngrams(doc, 2) for doc in corpus]
-            self.field_indexes[field] = BM25Okapi(tokenized_corpus)
+            corpus = [normalize_text(str(doc.get(field, ""))) for doc in self.data]
+            self.field_indexes[field] = SparseBM25.from_corpus(corpus)
+
+        # keep the first record for each id, as the previous linear scan did
+        self._id_index = {}
+        if self.unique_id_field is not None:
+            for record in self.data:
+                if self.unique_id_field in record:
+                    self._id_index.setdefault(record[self.unique_id_field], record)
 
     @classmethod
     def from_json_lines(
@@ -35,8 +162,7 @@ class KYCQueryEngine:
         unique_id_field: str | None = None,
         ngram_size: int = 2,
     ):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data_rows = [json.loads(line) for line in f]
+        data_rows = read_json_lines(file_path)
         return cls(data_rows, text_fields_to_index, ngram_size, unique_id_field)
 
     def query_bm25(self, text: str, query_field: str, top_n: int = 5) -> list[dict]:
@@ -58,9 +184,13 @@ class KYCQueryEngine:
         else:
             index = self.field_indexes[query_field]
 
-        tokenized_query = char_ngrams(text, self.ngram_size)
-        scores = index.get_scores(tokenized_query)
-        top_n_indices = scores.argsort()[-top_n:][::-1]
+        scores = index.get_scores(text)
+        # partition out the top k in O(N), then sort only those k
+        k = min(top_n, len(scores))
+        if k <= 0:
+            return []
+        top_k = np.argpartition(scores, -k)[-k:]
+        top_n_indices = top_k[np.argsort(scores[top_k])[::-1]]
 
         res = [self.data[i] for i in top_n_indices]
 
@@ -79,7 +209,4 @@ class KYCQueryEngine:
         if self.unique_id_field is None:
             raise ValueError("Unique ID field is not set.")
 
-        for record in self.data:
-            if record.get(self.unique_id_field) == unique_id_value:
-                return record
-        return None
+        return self._id_index.get(unique_id_value)
@@ -1,8 +1,12 @@
 from mcp.server.fastmcp import FastMCP
 from kyc_data_tools import KYCQueryEngine
+import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 
+log = logging.getLogger(__name__)
+
 MCP = FastMCP(host="127.0.0.1", port=8000, stateless_http=True)
 
 KYC_DATA_PATH = os.environ.get("KYC_DATA_PATH", "./synthetic_data")
@@ -33,23 +37,81 @@ def get_kyc_data_index():
 
     kyc_index_data = {}
 
-    kyc_data_files = Path(KYC_DATA_PATH).glob("synthetic_*.json")
-
-    if not kyc_data_files:
-        raise FileNotFoundError(f"No KYC data files found in path: {KYC_DATA_PATH}")
+    # sorted so that index build order is deterministic across runs
+    kyc_data_files = sorted(Path(KYC_DATA_PATH).glob("synthetic_*.json"))
 
     for file in kyc_data_files:
         file_name = file.stem
         display_name = file_name.replace("synthetic_", "").split(".")[0]
+        if display_name not in KYC_INDEX_FIELDS:
+            log.warning("Skipping unknown KYC data file: %s", file)
+            continue
         kyc_index_data[display_name] = KYCQueryEngine.from_json_lines(
             file_path=file,
             unique_id_field=KYC_INDEX_FIELDS[display_name]["unique_id"],
             text_fields_to_index=KYC_INDEX_FIELDS[display_name]["text_fields"],
         )
 
+    if not kyc_index_data:
+        raise FileNotFoundError(f"No known KYC data files found in path: {KYC_DATA_PATH}")
+
     return kyc_index_data
 
 
+# the agent often repeats the same search across turns, so BM25 results are cached
+# per (query, query_field, top_n); tuples keep the cached results immutable
+@lru_cache(maxsize=1024)
+def _credit_report_search_cached(
+    query: str, query_field: str, top_n: int
+) -> tuple[dict, ...]:
+    return tuple(
+        KYC_INDEXED_DATA["credit_reports"].query_bm25(
+            text=query, query_field=query_field, top_n=top_n
+        )
+    )
+
+
+@lru_cache(maxsize=1024)
+def _income_verification_search_cached(
+    employee_name: str, top_n: int
+) -> tuple[dict, ...]:
+    return tuple(
+        KYC_INDEXED_DATA["income_verification"].query_bm25(
+            text=employee_name, query_field="employee_name", top_n=top_n
+        )
+    )
+
+
+@lru_cache(maxsize=1024)
+def _property_records_search_cached(
+    query: str, query_field: str, top_n: int
+) -> tuple[dict, ...]:
+    return tuple(
+        KYC_INDEXED_DATA["property_records"].query_bm25(
+            text=query, query_field=query_field, top_n=top_n
+        )
+    )
+
+
+@lru_cache(maxsize=1024)
+def _lien_records_search_cached(
+    query: str, query_field: str, top_n: int
+) -> tuple[dict, ...]:
+    return tuple(
+        KYC_INDEXED_DATA["lien_records"].query_bm25(
+            text=query, query_field=query_field, top_n=top_n
+        )
+    )
+
+
+def _invalidate_caches():
+    """Clear cached search results, e.g. after KYC_INDEXED_DATA is reloaded."""
+    _credit_report_search_cached.cache_clear()
+    _income_verification_search_cached.cache_clear()
+    _property_records_search_cached.cache_clear()
+    _lien_records_search_cached.cache_clear()
+
+
 @MCP.tool()
 def credit_report_search(query: str, query_field: str, top_n: int = 3) -> list:
     """Search credit reports for relevant entries based on a query.
@@ -62,10 +124,7 @@ def credit_report_search(query: str, query_field: str, top_n: int = 3) -> list:
     Returns:
         list: A list of relevant credit report entries.
     """
-    results = KYC_INDEXED_DATA["credit_reports"].query_bm25(
-        text=query, query_field=query_field, top_n=top_n
-    )
-    return results
+    return list(_credit_report_search_cached(query, query_field, top_n))
 
 
 @MCP.tool()
@@ -79,10 +138,7 @@ def income_verification_search(employee_name: str, top_n: int = 3) -> list:
     Returns:
         list: A list of relevant income verification entries.
     """
-    results = KYC_INDEXED_DATA["income_verification"].query_bm25(
-        text=employee_name, query_field="employee_name", top_n=top_n
-    )
-    return results
+    return list(_income_verification_search_cached(employee_name, top_n))
 
 
 @MCP.tool()
@@ -97,10 +153,7 @@ def property_records_search(query: str, query_field: str, top_n: int = 3) -> lis
     Returns:
         list: A list of relevant property record entries.
     """
-    results = KYC_INDEXED_DATA["property_records"].query_bm25(
-        text=query, query_field=query_field, top_n=top_n
-    )
-    return results
+    return list(_property_records_search_cached(query, query_field, top_n))
 
 
 @MCP.tool()
@@ -115,10 +168,7 @@ def lien_records_search(query: str, query_field: str, top_n: int = 3) -> list:
     Returns:
         list: A list of relevant lien record entries.
     """
-    results = KYC_INDEXED_DATA["lien_records"].query_bm25(
-        text=query, query_field=query_field, top_n=top_n
-    )
-    return results
+    return list(_lien_records_search_cached(query, query_field, top_n))
 
 
 @MCP.tool()
@@ -186,5 +236,6 @@ def get_lien_record_by_id(lien_id: str) -> dict:
 if __name__ == "__main__":
 
     KYC_INDEXED_DATA = get_kyc_data_index()
+    _invalidate_caches()
 
     MCP.run(transport="streamable-http")